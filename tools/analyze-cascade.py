@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Cascade Analysis Tool for Tootles Themes
+Copyright Jascha Wanger 2025
+
+This script finds declarations that can never win the cascade: properties
+set twice in one rule, declarations overridden by a later rule with the same
+selector, and variables redefined in `:root`. Declarations are indexed by
+(selector, property, at-rule context) in a single pass, so the analysis
+stays near-linear on large stylesheets. Shadowed declarations can be
+reported with exact source locations or removed in place.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from css_parser import Declaration, Rule, Stylesheet, parse_stylesheet
+
+
+# Differing values that use vendor prefixes are usually intentional
+# fallbacks, e.g. `display: -webkit-box; display: flex;`
+VENDOR_VALUE = re.compile(r'(?:^|[\s(,])-(?:webkit|moz|ms|o)-', re.IGNORECASE)
+
+# Browsers drop a whole rule when one selector in its list is invalid for
+# them, so rules naming vendor-prefixed pseudo-classes or pseudo-elements
+# may not apply at all and cannot shadow anything
+VENDOR_SELECTOR = re.compile(r'::?-(?:webkit|moz|ms|o)-', re.IGNORECASE)
+
+# Value tokens that every supported browser parses: 3- and 6-digit hex
+# colors, strings and numbers with long-established units. Keywords count
+# only if listed in PLAIN_KEYWORDS. A winning value made only of these
+# always applies, so an earlier differing value cannot be its fallback.
+# Anything else, e.g. `sticky`, `flow-root`, `clip` or `#ffffff80`, may be
+# dropped by some browsers, so the earlier declaration is kept.
+PLAIN_TOKEN = re.compile(
+    r'#(?:[0-9a-f]{3}|[0-9a-f]{6})|"[^"]*"|\'[^\']*\'|'
+    r'[+-]?(?:\d+\.?\d*|\.\d+)(?:px|em|rem|%|pt|vh|vw|vmin|vmax|ch|ex|s|ms|deg)?',
+    re.IGNORECASE
+)
+
+# Keywords from CSS 2.1 and early CSS 3 modules
+PLAIN_KEYWORDS = frozenset({
+    'auto', 'none', 'inherit', 'normal',
+    # display, position, float, overflow, visibility
+    'block', 'inline', 'inline-block', 'list-item', 'table', 'table-row',
+    'table-cell', 'static', 'relative', 'absolute', 'fixed', 'left', 'right',
+    'both', 'hidden', 'visible', 'scroll',
+    # alignment and box model
+    'top', 'bottom', 'middle', 'center', 'baseline', 'justify',
+    'border-box', 'content-box',
+    # text and fonts
+    'bold', 'bolder', 'lighter', 'italic', 'oblique', 'underline', 'overline',
+    'line-through', 'uppercase', 'lowercase', 'capitalize', 'nowrap', 'pre',
+    'pre-wrap', 'serif', 'sans-serif', 'monospace', 'cursive', 'fantasy',
+    'small', 'medium', 'large', 'x-small', 'x-large', 'thin', 'thick',
+    # borders, lists, backgrounds and tables
+    'solid', 'dashed', 'dotted', 'double', 'groove', 'ridge', 'inset', 'outset',
+    'disc', 'circle', 'square', 'decimal', 'repeat', 'no-repeat', 'repeat-x',
+    'repeat-y', 'collapse', 'separate',
+    # cursors and transitions
+    'default', 'pointer', 'text', 'move', 'wait', 'help', 'crosshair',
+    'ease', 'linear', 'ease-in', 'ease-out', 'ease-in-out',
+    # colors
+    'transparent', 'black', 'silver', 'gray', 'white', 'maroon', 'red',
+    'purple', 'fuchsia', 'green', 'lime', 'olive', 'yellow', 'navy', 'blue',
+    'teal', 'aqua', 'orange'
+})
+
+
+class ShadowedDeclaration(NamedTuple):
+    """A declaration that loses the cascade to a later or stronger one."""
+    declaration: Declaration
+    rule: Rule
+    winner: Declaration
+    reason: str
+
+
+class _Entry(NamedTuple):
+    declaration: Declaration
+    rule: Rule
+    order: int
+
+
+def split_selector_list(selector: str) -> List[str]:
+    """Split a selector list on top-level commas and normalize whitespace."""
+    parts = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(selector):
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth = max(0, depth - 1)
+        elif char == ',' and depth == 0:
+            parts.append(selector[start:index])
+            start = index + 1
+    parts.append(selector[start:])
+    return [
+        re.sub(r'\s*([>+~])\s*', r' \1 ', ' '.join(part.split())).strip()
+        for part in parts if part.strip()
+    ]
+
+
+class CascadeAnalyzer:
+    """Finds fully shadowed declarations in a stylesheet."""
+
+    def analyze(self, content: str) -> List[ShadowedDeclaration]:
+        """Analyze CSS content; see analyze_stylesheet."""
+        return self.analyze_stylesheet(parse_stylesheet(content))
+
+    def analyze_stylesheet(self, stylesheet: Stylesheet) -> List[ShadowedDeclaration]:
+        """
+        Analyze a parsed stylesheet for declarations that can never take effect.
+
+        A declaration is shadowed for a selector when another declaration of
+        the same property for the same selector wins: it is `!important`
+        where the first is not, or has equal importance and comes later.
+        Declarations in conditional at-rules (such as `@media`) are also
+        shadowed by winning unconditional declarations, which apply
+        whenever the condition does. Rules in selector lists are shadowed
+        only if every selector in the list is shadowed.
+
+        A winner with a different value only shadows a declaration when the
+        winning value is plain (see PLAIN_TOKEN) or the property is a custom
+        property. Otherwise the earlier declaration may be a fallback for
+        browsers that drop the winner, e.g. `height: 100vh; height: 100dvh;`,
+        and it is kept. Rules with vendor-prefixed pseudo-classes or
+        pseudo-elements in their selector list never shadow other rules.
+
+        Args:
+            stylesheet: Parsed stylesheet to analyze
+
+        Returns:
+            Shadowed declarations in source order
+        """
+        entries: List[Tuple[_Entry, List[str]]] = []
+        winners: Dict[Tuple[str, str, Tuple[str, ...]], _Entry] = {}
+
+        order = 0
+        for rule in stylesheet.rules:
+            if not self._is_analyzable(rule):
+                continue
+            selectors = split_selector_list(rule.selector)
+            can_win = not VENDOR_SELECTOR.search(rule.selector)
+            for declaration in rule.declarations:
+                entry = _Entry(declaration, rule, order)
+                order += 1
+                entries.append((entry, selectors))
+                if not can_win:
+                    continue
+                for selector in selectors:
+                    key = (selector, declaration.property, rule.context)
+                    current = winners.get(key)
+                    if current is None or self._beats(entry, current):
+                        winners[key] = entry
+
+        shadowed = []
+        for entry, selectors in entries:
+            winner = None
+            for selector in selectors:
+                beaten_by = self._find_winner(entry, selector, winners)
+                if beaten_by is None:
+                    winner = None
+                    break
+                if winner is None or beaten_by.order > winner.order:
+                    winner = beaten_by
+            if winner is not None:
+                shadowed.append(ShadowedDeclaration(
+                    declaration=entry.declaration,
+                    rule=entry.rule,
+                    winner=winner.declaration,
+                    reason=self._describe(entry, winner)
+                ))
+        return shadowed
+
+    def _is_analyzable(self, rule: Rule) -> bool:
+        """Skip rules whose cascade this analysis does not model."""
+        if rule.selector.startswith('@'):
+            # @font-face, @page and similar descriptor blocks
+            return False
+        return not any(
+            context.lower().startswith(('@keyframes', '@-webkit-keyframes', '@layer'))
+            for context in rule.context
+        )
+
+    def _beats(self, challenger: _Entry, current: _Entry) -> bool:
+        """Return True if challenger wins the cascade over current."""
+        return (challenger.declaration.important, challenger.order) > \
+            (current.declaration.important, current.order)
+
+    def _find_winner(self, entry: _Entry, selector: str,
+                     winners: Dict[Tuple[str, str, Tuple[str, ...]], _Entry]) -> Optional[_Entry]:
+        """Return the declaration that shadows entry for one selector, if any."""
+        prop = entry.declaration.property
+        candidates = [winners.get((selector, prop, entry.rule.context))]
+        if entry.rule.context:
+            candidates.append(winners.get((selector, prop, ())))
+
+        for candidate in candidates:
+            if candidate is None or candidate is entry:
+                continue
+            if not self._beats(candidate, entry):
+                continue
+            if self._is_fallback(entry.declaration, candidate.declaration):
+                continue
+            return candidate
+        return None
+
+    def _is_fallback(self, loser: Declaration, winner: Declaration) -> bool:
+        """Return True if loser may apply in browsers that drop winner."""
+        if loser.value == winner.value or loser.property.startswith('--'):
+            # Custom properties accept any value, so the winner is never dropped
+            return False
+        if VENDOR_VALUE.search(loser.value) or VENDOR_VALUE.search(winner.value):
+            return True
+        return not self._is_plain(winner.value)
+
+    def _is_plain(self, value: str) -> bool:
+        """Return True if every token of a value is plain (see PLAIN_TOKEN)."""
+        # Quoted strings may contain separators, so match them first
+        tokens = re.findall(r'"[^"]*"|\'[^\']*\'|[^\s,/"\']+|["\']', value)
+        return all(
+            token.lower() in PLAIN_KEYWORDS or PLAIN_TOKEN.fullmatch(token)
+            for token in tokens
+        )
+
+    def _describe(self, entry: _Entry, winner: _Entry) -> str:
+        location = f"line {winner.declaration.line}:{winner.declaration.column}"
+        if winner.rule is entry.rule:
+            return f"set again in the same rule at {location}"
+        if winner.declaration.important and not entry.declaration.important:
+            return f"overridden by !important declaration at {location}"
+        if entry.declaration.property.startswith('--') and ':root' in entry.rule.selector:
+            return f"redefined at {location}"
+        return f"overridden by later rule at {location}"
+
+
+def remove_declarations(content: str, shadowed: List[ShadowedDeclaration],
+                        stylesheet: Optional[Stylesheet] = None) -> str:
+    """
+    Remove shadowed declarations from CSS content.
+
+    Rules left without declarations are removed as a whole, as are `@media`
+    and other grouping blocks left without rules. Lines left empty by a
+    removal are dropped, so the remaining formatting is preserved.
+
+    Args:
+        content: CSS content the declarations were found in
+        shadowed: Declarations to remove
+        stylesheet: The parsed content, if already available
+
+    Returns:
+        CSS content without the shadowed declarations
+    """
+    by_rule: Dict[int, List[ShadowedDeclaration]] = {}
+    for item in shadowed:
+        by_rule.setdefault(item.rule.start, []).append(item)
+
+    spans = []
+    removed_rules = set()
+    for rule_start, items in by_rule.items():
+        rule = items[0].rule
+        if len(items) == len(rule.declarations):
+            spans.append((rule.start, rule.end))
+            removed_rules.add(rule_start)
+        else:
+            spans.extend((item.declaration.start, item.declaration.end) for item in items)
+
+    if removed_rules:
+        if stylesheet is None:
+            stylesheet = parse_stylesheet(content)
+        # removed_before[i] counts removed rules among the first i rules
+        removed_before = [0]
+        for rule in stylesheet.rules:
+            removed_before.append(removed_before[-1] + (rule.start in removed_rules))
+        for block in stylesheet.blocks:
+            count = block.last_rule - block.first_rule
+            removed = removed_before[block.last_rule] - removed_before[block.first_rule]
+            if count and removed == count:
+                spans.append((block.start, block.end))
+    spans.sort()
+
+    pieces = []
+    pos = 0
+    for start, end in spans:
+        if end <= pos:
+            # Nested in a block that is already removed
+            continue
+        # Only scan the whitespace around the span, which keeps this linear
+        # even when a minified stylesheet is a single line
+        before = start
+        while before > pos and content[before - 1] in ' \t':
+            before -= 1
+        after = end
+        while after < len(content) and content[after] in ' \t\r':
+            after += 1
+        if (before == 0 or content[before - 1] == '\n') and \
+                (after == len(content) or content[after] == '\n'):
+            # The span is alone on its line(s)
+            end = min(after + 1, len(content))
+        # Otherwise neighbouring code stays, without the whitespace before the span
+        pieces.append(content[pos:before])
+        pos = max(pos, end)
+    pieces.append(content[pos:])
+    return ''.join(pieces)
+
+
+def format_report(file_path: Path, shadowed: List[ShadowedDeclaration]) -> str:
+    """Generate a formatted report of shadowed declarations."""
+    lines = []
+    for item in shadowed:
+        declaration = item.declaration
+        context = f" in {' '.join(item.rule.context)}" if item.rule.context else ''
+        lines.append(
+            f"  {file_path}:{declaration.line}:{declaration.column}: "
+            f"'{declaration.property}' in '{item.rule.selector}'{context} "
+            f"is {item.reason}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """Main entry point for the cascade analyzer."""
+    parser = argparse.ArgumentParser(
+        description="Find dead and overridden declarations in Tootles themes",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s theme.css                    # Report shadowed declarations
+  %(prog)s themes/cyberpunk/            # Analyze all themes in directory
+  %(prog)s --fix theme.css              # Remove shadowed declarations in place
+        """
+    )
+
+    parser.add_argument(
+        'path',
+        type=Path,
+        help='Path to CSS file or directory to analyze'
+    )
+
+    parser.add_argument(
+        '--fix',
+        action='store_true',
+        help='Remove shadowed declarations from the files'
+    )
+
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Only show the final result'
+    )
+
+    args = parser.parse_args()
+
+    if not args.path.exists():
+        print(f"Error: Path does not exist: {args.path}")
+        return 1
+
+    if args.path.is_file():
+        css_files = [args.path]
+    else:
+        css_files = sorted(args.path.glob("*.css"))
+        if not css_files:
+            print(f"No CSS files found in {args.path}")
+            return 1
+
+    analyzer = CascadeAnalyzer()
+    total = 0
+    for css_file in css_files:
+        try:
+            content = css_file.read_text(encoding='utf-8')
+        except UnicodeDecodeError:
+            print(f"Error: File must be UTF-8 encoded: {css_file}")
+            return 1
+
+        stylesheet = parse_stylesheet(content)
+        shadowed = analyzer.analyze_stylesheet(stylesheet)
+        total += len(shadowed)
+        if not shadowed:
+            continue
+
+        if not args.quiet:
+            print(f"\n{css_file.name}: {len(shadowed)} shadowed declaration(s)")
+            print(format_report(css_file, shadowed))
+        if args.fix:
+            fixed = remove_declarations(content, shadowed, stylesheet)
+            css_file.write_text(fixed, encoding='utf-8')
+
+    if total == 0:
+        print("\n✅ No shadowed declarations found!")
+        return 0
+    if args.fix:
+        print(f"\n🧹 Removed {total} shadowed declaration(s)")
+        return 0
+    print(f"\n⚠️  Found {total} shadowed declaration(s); run with --fix to remove them")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark for Tootles Theme Tools
+Copyright Jascha Wanger 2025
+
+This script measures the wall-clock time from process launch to first result
+for the command-line tools, which editors and git hooks invoke many times a
+day. Each tool is run repeatedly in a fresh interpreter and the median is
+compared against a target budget.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+
+TOOLS_DIR = Path(__file__).resolve().parent
+DEFAULT_THEME = TOOLS_DIR.parent / 'themes' / 'cyberpunk' / 'cyberpunk.css'
+
+
+def time_command(command: List[str], runs: int) -> List[float]:
+    """
+    Run a command repeatedly and record its wall-clock time.
+
+    Args:
+        command: Command line to execute
+        runs: Number of timed runs, after one untimed warm-up run
+
+    Returns:
+        Timings in milliseconds
+
+    Raises:
+        subprocess.CalledProcessError: If any run exits with a non-zero
+            status, since a failed run does not time a real result
+    """
+    # Warm the OS file cache and bytecode caches first
+    subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def build_commands(theme: Path, output_dir: Path) -> Dict[str, List[str]]:
+    """Return the benchmarked command lines keyed by label."""
+    python = sys.executable
+    return {
+        'interpreter baseline': [python, '-c', 'pass'],
+        'validate-theme.py': [
+            python, str(TOOLS_DIR / 'validate-theme.py'), '--quiet', str(theme)
+        ],
+        'preview-generator.py --sections': [
+            python, str(TOOLS_DIR / 'preview-generator.py'), str(theme),
+            '-o', str(output_dir / 'preview.html'), '--sections', 'typography'
+        ],
+        'preview-generator.py': [
+            python, str(TOOLS_DIR / 'preview-generator.py'), str(theme),
+            '-o', str(output_dir / 'preview.html')
+        ]
+    }
+
+
+def main():
+    """Main entry point for the startup benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Measure startup time of the Tootles theme tools",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                              # Benchmark against the cyberpunk theme
+  %(prog)s --runs 50 --target-ms 30     # More runs, tighter budget
+  %(prog)s themes/my-theme/my-theme.css # Benchmark with another theme
+        """
+    )
+
+    parser.add_argument(
+        'theme',
+        type=Path,
+        nargs='?',
+        default=DEFAULT_THEME,
+        help='CSS theme file to run the tools against'
+    )
+
+    parser.add_argument(
+        '--runs',
+        type=int,
+        default=20,
+        help='Number of timed runs per tool (default: 20)'
+    )
+
+    parser.add_argument(
+        '--target-ms',
+        type=float,
+        default=40.0,
+        help='Median time-to-first-result budget per tool (default: 40)'
+    )
+
+    args = parser.parse_args()
+
+    if not args.theme.is_file():
+        print(f"Error: Theme file not found: {args.theme}")
+        return 1
+
+    if args.runs < 1:
+        print("Error: --runs must be at least 1")
+        return 1
+
+    success = True
+    with tempfile.TemporaryDirectory() as output_dir:
+        commands = build_commands(args.theme, Path(output_dir))
+
+        print(f"{'Command':<36} {'min':>8} {'median':>8} {'max':>8}")
+        for label, command in commands.items():
+            try:
+                timings = time_command(command, args.runs)
+            except subprocess.CalledProcessError as e:
+                success = False
+                print(f"{label:<36} exited with status {e.returncode} ❌")
+                stderr = e.stderr.decode('utf-8', errors='replace').strip()
+                if stderr:
+                    print(f"  {stderr.splitlines()[-1]}")
+                continue
+
+            median = statistics.median(timings)
+
+            # The interpreter baseline is informational only
+            is_tool = label != 'interpreter baseline'
+            status = ''
+            if is_tool:
+                status = '✅' if median <= args.target_ms else '❌'
+                if median > args.target_ms:
+                    success = False
+
+            print(
+                f"{label:<36} {min(timings):>6.1f}ms {median:>6.1f}ms "
+                f"{max(timings):>6.1f}ms {status}"
+            )
+
+    print(f"\nTarget: median under {args.target_ms:.0f}ms per tool")
+    if success:
+        print("🎉 All tools are within the startup budget!")
+        return 0
+    print("💥 Startup budget exceeded or a tool failed!")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
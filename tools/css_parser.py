@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Lightweight CSS Parser for Tootles Themes
+Copyright Jascha Wanger 2025
+
+This module provides a small, dependency-free CSS parser shared by the theme
+tools. It understands just enough CSS to split a stylesheet into rules,
+declarations and at-rule contexts while keeping exact source offsets, which
+is all the tooling needs for token extraction and theme analysis.
+"""
+
+import re
+from bisect import bisect_right
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+
+# At-rules whose blocks contain nested rules rather than declarations
+GROUPING_AT_RULES = ('@media', '@supports', '@container', '@layer', '@document')
+
+
+class Declaration(NamedTuple):
+    """A single `property: value` declaration inside a rule."""
+    property: str
+    value: str
+    important: bool
+    line: int
+    column: int
+    start: int
+    end: int
+
+
+class Rule(NamedTuple):
+    """A style rule with its selector, at-rule context and declarations."""
+    selector: str
+    context: Tuple[str, ...]
+    declarations: List[Declaration]
+    line: int
+    start: int
+    end: int
+
+
+class GroupingBlock(NamedTuple):
+    """A grouping at-rule block, such as `@media`, and the rules it contains."""
+    prelude: str
+    start: int
+    end: int
+    # Slice of Stylesheet.rules nested in the block, at any depth
+    first_rule: int
+    last_rule: int
+
+
+class Stylesheet(NamedTuple):
+    """Parsed representation of a CSS file."""
+    rules: List[Rule]
+    imports: List[str]
+    blocks: List[GroupingBlock]
+
+
+def strip_comments(content: str) -> str:
+    """
+    Blank out CSS comments while preserving offsets.
+
+    Comment characters are replaced with spaces (newlines are kept), so
+    positions in the returned text map one-to-one onto the original.
+    Unterminated comments run to the end of the file, as in browsers.
+    """
+    def blank(match: 're.Match') -> str:
+        return re.sub(r'[^\n]', ' ', match.group(0))
+
+    return re.sub(r'/\*.*?(?:\*/|\Z)', blank, content, flags=re.DOTALL)
+
+
+def parse_stylesheet(content: str) -> Stylesheet:
+    """
+    Parse CSS content into rules and @import targets.
+
+    Args:
+        content: Raw CSS text
+
+    Returns:
+        Stylesheet with rules in source order and imported URLs
+    """
+    return _Parser(content).parse()
+
+
+def parse_import_target(prelude: str) -> Optional[str]:
+    """Extract the URL from an `@import` prelude, e.g. `url("base.css") screen`."""
+    # Quoted URLs may contain spaces; bare url(...) arguments may not
+    match = re.match(
+        r'@import\s+(?:"([^"]*)"|\'([^\']*)\'|'
+        r'url\(\s*(?:"([^"]*)"|\'([^\']*)\'|([^\'")\s]+)))',
+        prelude.strip(),
+        re.IGNORECASE
+    )
+    if not match:
+        return None
+    return next((url for url in match.groups() if url), None)
+
+
+def resolve_import_path(url: str, importer: Path) -> Optional[Path]:
+    """Resolve a local `@import` URL relative to the importing file."""
+    if re.match(r'^(?:[a-z][a-z0-9+.-]*:|//)', url, re.IGNORECASE):
+        # Remote and data URLs are outside the theme corpus
+        return None
+    return (importer.parent / url.split('?', 1)[0].split('#', 1)[0]).resolve()
+
+
+class _Parser:
+    """Single-pass scanner that tracks strings, parentheses and block nesting."""
+
+    def __init__(self, content: str):
+        self.text = strip_comments(content)
+        self.line_starts = [0] + [m.end() for m in re.finditer(r'\n', self.text)]
+        self.rules: List[Rule] = []
+        self.imports: List[str] = []
+        self.blocks: List[GroupingBlock] = []
+
+    def parse(self) -> Stylesheet:
+        self._parse_block(0, len(self.text), ())
+        return Stylesheet(self.rules, self.imports, self.blocks)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """Convert an offset into a 1-based (line, column) pair."""
+        index = bisect_right(self.line_starts, offset) - 1
+        return index + 1, offset - self.line_starts[index] + 1
+
+    def _skip_string(self, pos: int) -> int:
+        """Return the offset just past the string literal starting at pos."""
+        quote = self.text[pos]
+        pos += 1
+        while pos < len(self.text):
+            char = self.text[pos]
+            if char == '\\':
+                pos += 2
+                continue
+            if char == quote or char == '\n':
+                return pos + 1
+            pos += 1
+        return pos
+
+    def _find_block_end(self, pos: int, end: int) -> int:
+        """Return the offset of the `}` matching the `{` just before pos."""
+        depth = 1
+        while pos < end:
+            char = self.text[pos]
+            if char in '"\'':
+                pos = self._skip_string(pos)
+                continue
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    return pos
+            pos += 1
+        return end
+
+    def _parse_block(self, start: int, end: int, context: Tuple[str, ...]) -> None:
+        """Parse a sequence of rules and at-rules between two offsets."""
+        pos = start
+        prelude_start = start
+        paren_depth = 0
+        while pos < end:
+            char = self.text[pos]
+            if char in '"\'':
+                pos = self._skip_string(pos)
+                continue
+            if char == '(':
+                paren_depth += 1
+            elif char == ')':
+                paren_depth = max(0, paren_depth - 1)
+            elif char == ';' and paren_depth == 0:
+                prelude = self.text[prelude_start:pos].strip()
+                if prelude.lower().startswith('@import'):
+                    target = parse_import_target(prelude)
+                    if target:
+                        self.imports.append(target)
+                prelude_start = pos + 1
+            elif char == '}':
+                # Stray closing brace; skip it and resynchronise
+                prelude_start = pos + 1
+            elif char == '{':
+                block_end = self._find_block_end(pos + 1, end)
+                prelude = ' '.join(self.text[prelude_start:pos].split())
+                lowered = prelude.lower()
+                block_start = prelude_start + (
+                    len(self.text[prelude_start:pos])
+                    - len(self.text[prelude_start:pos].lstrip())
+                )
+                if lowered.startswith(GROUPING_AT_RULES) or lowered.startswith(
+                    ('@keyframes', '@-webkit-keyframes')
+                ):
+                    first_rule = len(self.rules)
+                    self._parse_block(pos + 1, block_end, context + (prelude,))
+                    self.blocks.append(GroupingBlock(
+                        prelude=prelude,
+                        start=block_start,
+                        end=min(block_end + 1, len(self.text)),
+                        first_rule=first_rule,
+                        last_rule=len(self.rules)
+                    ))
+                else:
+                    self.rules.append(Rule(
+                        selector=prelude,
+                        context=context,
+                        declarations=self._parse_declarations(pos + 1, block_end),
+                        line=self.position(block_start)[0],
+                        start=block_start,
+                        end=min(block_end + 1, len(self.text))
+                    ))
+                pos = block_end + 1
+                prelude_start = pos
+                paren_depth = 0
+                continue
+            pos += 1
+
+    def _parse_declarations(self, start: int, end: int) -> List[Declaration]:
+        """Split a declaration block into declarations with source offsets."""
+        declarations: List[Declaration] = []
+        pos = start
+        decl_start = start
+        paren_depth = 0
+        while pos <= end:
+            char = self.text[pos] if pos < end else ';'
+            if char in '"\'' and pos < end:
+                pos = self._skip_string(pos)
+                continue
+            if char == '(':
+                paren_depth += 1
+            elif char == ')':
+                paren_depth = max(0, paren_depth - 1)
+            elif char == ';' and (paren_depth == 0 or pos == end):
+                declaration = self._make_declaration(decl_start, pos, end)
+                if declaration:
+                    declarations.append(declaration)
+                decl_start = pos + 1
+            pos += 1
+        return declarations
+
+    def _make_declaration(self, start: int, stop: int, block_end: int) -> Optional[Declaration]:
+        raw = self.text[start:stop]
+        if ':' not in raw:
+            return None
+        name, value = raw.split(':', 1)
+        name = name.strip()
+        if not name:
+            return None
+        value = value.strip()
+        important = False
+        match = re.search(r'!\s*important\s*$', value, re.IGNORECASE)
+        if match:
+            important = True
+            value = value[:match.start()].rstrip()
+        offset = start + (len(raw) - len(raw.lstrip()))
+        line, column = self.position(offset)
+        # Include the terminating semicolon in the declaration span
+        decl_end = stop + 1 if stop < block_end else stop
+        return Declaration(
+            property=name if name.startswith('--') else name.lower(),
+            value=value,
+            important=important,
+            line=line,
+            column=column,
+            start=offset,
+            end=decl_end
+        )
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Theme Token Manifest Exporter for Tootles Themes
+Copyright Jascha Wanger 2025
+
+This script resolves the design tokens of every theme in a corpus into a
+single compact manifest, so clients can list themes with their colors and
+fonts without downloading or parsing any CSS. The manifest is available as
+JSON and as a binary file with a string table that can be memory-mapped.
+"""
+
+import argparse
+import json
+import mmap
+import re
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from css_parser import Rule, Stylesheet, parse_stylesheet, resolve_import_path
+
+
+MANIFEST_VERSION = 1
+
+# Custom property prefixes exported as design tokens
+TOKEN_PREFIXES = ('--bg-', '--text-', '--accent-', '--color-', '--font-family-')
+
+# Binary layout (little-endian):
+#   header       magic, version, reserved, theme count, string count,
+#                string index offset, theme table offset
+#   theme table  per theme: name, file, light pairs offset/count,
+#                dark pairs offset/count (string ids and absolute offsets)
+#   token pairs  (name id, value id), sorted by token name per scope
+#   string index per string: absolute offset and byte length of UTF-8 data
+#   string data  concatenated UTF-8 strings
+BINARY_MAGIC = b'TTKM'
+HEADER = struct.Struct('<4sHHIIII')
+THEME_ENTRY = struct.Struct('<IIIIII')
+TOKEN_PAIR = struct.Struct('<II')
+STRING_ENTRY = struct.Struct('<II')
+
+DARK_SELECTOR = re.compile(
+    r'^(?::root|html|body)?\s*\[data-theme\s*=\s*["\']?dark["\']?\s*\]$'
+)
+LIGHT_SELECTORS = {':root', 'html'}
+
+
+class TokenExtractor:
+    """Extracts resolved design tokens per light/dark scope from a theme."""
+
+    def __init__(self):
+        # Imported files are parsed once, however many themes share them
+        self._import_cache: Dict[Path, Optional[Stylesheet]] = {}
+
+    def extract(self, content: str, file_path: Optional[Path] = None) -> Dict[str, Dict[str, str]]:
+        """
+        Resolve the design tokens defined by a theme's CSS.
+
+        Args:
+            content: CSS content of the theme
+            file_path: Path of the theme. When given, local `@import`
+                targets are followed and their tokens merged in before the
+                theme's own declarations, as in the browser cascade.
+
+        Returns:
+            Mapping with `light` and `dark` token dictionaries. The dark scope
+            only lists tokens whose effective value differs from light.
+        """
+        light: Dict[str, str] = {}
+        dark: Dict[str, str] = {}
+
+        stylesheet = parse_stylesheet(content)
+        rules: List[Rule] = []
+        if file_path is not None:
+            root = file_path.resolve()
+            rules.extend(self._imported_rules(stylesheet.imports, root, {root}))
+        rules.extend(stylesheet.rules)
+
+        for rule in rules:
+            scope = self._rule_scope(rule.selector, rule.context)
+            if scope is None:
+                continue
+            target = light if scope == 'light' else dark
+            for declaration in rule.declarations:
+                if declaration.property.startswith('--'):
+                    target[declaration.property] = declaration.value
+
+        resolved_light = self._resolve_scope(light)
+        resolved_dark = self._resolve_scope({**light, **dark}) if dark else {}
+
+        return {
+            'light': self._select_tokens(resolved_light),
+            'dark': {
+                name: value
+                for name, value in self._select_tokens(resolved_dark).items()
+                if resolved_light.get(name) != value
+            }
+        }
+
+    def _imported_rules(self, urls: List[str], importer: Path, visited: Set[Path]) -> List[Rule]:
+        """
+        Collect the rules of imported stylesheets in cascade order.
+
+        Each file contributes once; cycles, remote URLs and unreadable files
+        are skipped, since the validator reports them.
+        """
+        rules: List[Rule] = []
+        for url in urls:
+            target = resolve_import_path(url, importer)
+            if target is None or target in visited:
+                continue
+            visited.add(target)
+
+            if target not in self._import_cache:
+                try:
+                    imported = parse_stylesheet(target.read_text(encoding='utf-8'))
+                except (OSError, UnicodeDecodeError):
+                    imported = None
+                self._import_cache[target] = imported
+            imported = self._import_cache[target]
+            if imported is None:
+                continue
+            rules.extend(self._imported_rules(imported.imports, target, visited))
+            rules.extend(imported.rules)
+        return rules
+
+    def _rule_scope(self, selector: str, context: Tuple[str, ...]) -> Optional[str]:
+        """Classify a rule as defining light tokens, dark tokens or neither."""
+        media_scope = 'light'
+        if context:
+            if len(context) != 1:
+                return None
+            scheme = re.search(
+                r'prefers-color-scheme\s*:\s*(light|dark)', context[0], re.IGNORECASE
+            )
+            if not scheme:
+                return None
+            media_scope = scheme.group(1).lower()
+
+        for part in selector.split(','):
+            part = part.strip()
+            if part in LIGHT_SELECTORS:
+                return media_scope
+            if DARK_SELECTOR.match(part):
+                return 'dark'
+        return None
+
+    def _resolve_scope(self, variables: Dict[str, str]) -> Dict[str, str]:
+        """Substitute `var()` references using the variables of one scope."""
+        resolved: Dict[str, str] = {}
+        for name in variables:
+            resolved[name] = self._resolve_value(variables[name], variables, (name,))
+        return resolved
+
+    def _resolve_value(self, value: str, variables: Dict[str, str],
+                       stack: Tuple[str, ...]) -> str:
+        """Recursively expand `var(--name, fallback)` references in a value."""
+        result = []
+        pos = 0
+        while True:
+            index = value.find('var(', pos)
+            if index == -1:
+                result.append(value[pos:])
+                break
+            result.append(value[pos:index])
+
+            depth = 0
+            close = index + 3
+            while close < len(value):
+                if value[close] == '(':
+                    depth += 1
+                elif value[close] == ')':
+                    depth -= 1
+                    if depth == 0:
+                        break
+                close += 1
+
+            inner = value[index + 4:close]
+            name, _, fallback = inner.partition(',')
+            name = name.strip()
+            if name in variables and name not in stack:
+                result.append(self._resolve_value(variables[name], variables, stack + (name,)))
+            elif fallback.strip():
+                result.append(self._resolve_value(fallback.strip(), variables, stack))
+            else:
+                # Undefined or cyclic reference: keep it for the client to handle
+                result.append(value[index:close + 1])
+            pos = close + 1
+
+        return ''.join(result).strip()
+
+    def _select_tokens(self, variables: Dict[str, str]) -> Dict[str, str]:
+        return {
+            name: variables[name]
+            for name in sorted(variables)
+            if name.startswith(TOKEN_PREFIXES)
+        }
+
+
+def build_manifest(css_files: List[Path], corpus_root: Path) -> Dict:
+    """
+    Build a token manifest for a list of theme files.
+
+    Args:
+        css_files: CSS theme files to include, in output order
+        corpus_root: Directory that manifest file paths are relative to
+
+    Returns:
+        Manifest dictionary ready to be serialized
+    """
+    extractor = TokenExtractor()
+    themes = []
+    for css_file in css_files:
+        tokens = extractor.extract(css_file.read_text(encoding='utf-8'), css_file)
+        themes.append({
+            'name': css_file.stem,
+            'file': css_file.relative_to(corpus_root).as_posix(),
+            'light': tokens['light'],
+            'dark': tokens['dark']
+        })
+    return {'version': MANIFEST_VERSION, 'themes': themes}
+
+
+def write_json_manifest(manifest: Dict, output_file: Path) -> None:
+    """Write the manifest as compact JSON."""
+    output_file.write_text(
+        json.dumps(manifest, separators=(',', ':'), ensure_ascii=False),
+        encoding='utf-8'
+    )
+
+
+def encode_binary_manifest(manifest: Dict) -> bytes:
+    """Encode a manifest into the binary format described above."""
+    strings: Dict[str, int] = {}
+
+    def intern(text: str) -> int:
+        if text not in strings:
+            strings[text] = len(strings)
+        return strings[text]
+
+    themes = manifest['themes']
+    table_offset = HEADER.size
+    pairs_offset = table_offset + THEME_ENTRY.size * len(themes)
+
+    theme_table = bytearray()
+    pairs = bytearray()
+    for theme in themes:
+        entry = [intern(theme['name']), intern(theme['file'])]
+        for scope in ('light', 'dark'):
+            tokens = theme[scope]
+            entry.extend((pairs_offset + len(pairs), len(tokens)))
+            for name in sorted(tokens):
+                pairs += TOKEN_PAIR.pack(intern(name), intern(tokens[name]))
+        theme_table += THEME_ENTRY.pack(*entry)
+
+    index_offset = pairs_offset + len(pairs)
+    data_offset = index_offset + STRING_ENTRY.size * len(strings)
+    string_index = bytearray()
+    string_data = bytearray()
+    for text in strings:
+        encoded = text.encode('utf-8')
+        string_index += STRING_ENTRY.pack(data_offset + len(string_data), len(encoded))
+        string_data += encoded
+
+    header = HEADER.pack(
+        BINARY_MAGIC, manifest['version'], 0,
+        len(themes), len(strings), index_offset, table_offset
+    )
+    return bytes(header + theme_table + pairs + string_index + string_data)
+
+
+def decode_binary_manifest(buffer) -> Dict:
+    """
+    Decode a binary manifest from any buffer (bytes or an mmap).
+
+    Args:
+        buffer: Object supporting the buffer protocol
+
+    Returns:
+        Manifest dictionary with the same shape as the JSON manifest
+    """
+    magic, version, _, theme_count, string_count, index_offset, table_offset = \
+        HEADER.unpack_from(buffer, 0)
+    if magic != BINARY_MAGIC:
+        raise ValueError("Not a Tootles token manifest")
+    if version != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version: {version}")
+
+    def string(string_id: int) -> str:
+        if string_id >= string_count:
+            raise ValueError(f"String id out of range: {string_id}")
+        offset, length = STRING_ENTRY.unpack_from(
+            buffer, index_offset + string_id * STRING_ENTRY.size
+        )
+        return bytes(buffer[offset:offset + length]).decode('utf-8')
+
+    themes = []
+    for index in range(theme_count):
+        name_id, file_id, light_offset, light_count, dark_offset, dark_count = \
+            THEME_ENTRY.unpack_from(buffer, table_offset + index * THEME_ENTRY.size)
+        theme = {'name': string(name_id), 'file': string(file_id)}
+        for scope, offset, count in (('light', light_offset, light_count),
+                                     ('dark', dark_offset, dark_count)):
+            tokens = {}
+            for pair in range(count):
+                key_id, value_id = TOKEN_PAIR.unpack_from(buffer, offset + pair * TOKEN_PAIR.size)
+                tokens[string(key_id)] = string(value_id)
+            theme[scope] = tokens
+        themes.append(theme)
+
+    return {'version': version, 'themes': themes}
+
+
+def read_binary_manifest(manifest_file: Path) -> Dict:
+    """Read a binary manifest through a read-only memory map."""
+    with open(manifest_file, 'rb') as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return decode_binary_manifest(mapped)
+
+
+def collect_css_files(path: Path) -> List[Path]:
+    """Return the theme files for a file or a corpus directory."""
+    if path.is_file():
+        return [path]
+    return sorted(path.rglob("*.css"))
+
+
+def main():
+    """Main entry point for the token exporter."""
+    parser = argparse.ArgumentParser(
+        description="Export a design token manifest for Tootles themes",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s themes/                              # Write theme-tokens.json
+  %(prog)s themes/ --format binary              # Write theme-tokens.bin
+  %(prog)s themes/ --format both -o dist/tokens # Write dist/tokens.{json,bin}
+        """
+    )
+
+    parser.add_argument(
+        'path',
+        type=Path,
+        help='Path to CSS file or directory containing themes'
+    )
+
+    parser.add_argument(
+        '-o', '--output',
+        type=Path,
+        default=Path('theme-tokens'),
+        help='Output file path; the extension is set by the format '
+             '(default: theme-tokens)'
+    )
+
+    parser.add_argument(
+        '--format',
+        choices=('json', 'binary', 'both'),
+        default='json',
+        help='Manifest format to write (default: json)'
+    )
+
+    args = parser.parse_args()
+
+    if not args.path.exists():
+        print(f"Error: Path does not exist: {args.path}")
+        return 1
+
+    css_files = collect_css_files(args.path)
+    if not css_files:
+        print(f"No CSS files found in {args.path}")
+        return 1
+
+    try:
+        corpus_root = args.path if args.path.is_dir() else args.path.parent
+        manifest = build_manifest(css_files, corpus_root)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error reading themes: {e}")
+        return 1
+
+    written = []
+    if args.format in ('json', 'both'):
+        json_file = args.output.with_suffix('.json')
+        write_json_manifest(manifest, json_file)
+        written.append(json_file)
+    if args.format in ('binary', 'both'):
+        binary_file = args.output.with_suffix('.bin')
+        binary_file.write_bytes(encode_binary_manifest(manifest))
+        written.append(binary_file)
+
+    for output_file in written:
+        print(f"Generated manifest: {output_file} ({output_file.stat().st_size} bytes)")
+    print(f"\n✅ Exported tokens for {len(manifest['themes'])} theme(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
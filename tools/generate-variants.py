@@ -0,0 +1,569 @@
+#!/usr/bin/env python3
+"""
+Theme Variant Generator for Tootles Themes
+Copyright Jascha Wanger 2025
+
+This script generates families of themes (hue-shifted accents, light and dark
+pairs, high-contrast variants, tint scales) from a palette spec and a template.
+Color transforms run in OKLCH on NumPy arrays covering every variant at once,
+and each generated theme is validated in the same run.
+"""
+
+import argparse
+import importlib.util
+import itertools
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from css_parser import Declaration, parse_stylesheet
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Token groups affected by each transform
+ACCENT_PREFIXES = ('--accent-', '--brand-', '--border-focus', '--text-link')
+SURFACE_PREFIXES = ('--bg-', '--border-')
+TEXT_PREFIXES = ('--text-',)
+
+# Dark variants mirror OKLCH lightness around this pivot (L' = pivot - L)
+DARK_LIGHTNESS_PIVOT = 1.2
+
+# OKLCH lightness ladder used for generated tint scales
+TINT_STEPS = {
+    100: 0.95, 200: 0.89, 300: 0.81, 400: 0.72, 500: 0.63,
+    600: 0.54, 700: 0.45, 800: 0.36, 900: 0.27
+}
+
+# Variant parameters with their neutral defaults
+DEFAULT_PARAMETERS = {
+    'hue_shift': 0.0,
+    'chroma': 1.0,
+    'mode': 'light',
+    'contrast': 0.0
+}
+
+HEX_COLOR = re.compile(r'^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$')
+
+
+class SpecError(Exception):
+    """Raised when a palette spec is malformed."""
+
+
+# === COLOR MATH ===
+
+def hex_to_rgb(values: List[str]) -> 'np.ndarray':
+    """Convert `#rgb` / `#rrggbb` strings into an (N, 3) array in [0, 1]."""
+    expanded = []
+    for value in values:
+        digits = value[1:]
+        if len(digits) == 3:
+            digits = ''.join(char * 2 for char in digits)
+        expanded.append([int(digits[i:i + 2], 16) for i in (0, 2, 4)])
+    return np.asarray(expanded, dtype=np.float64).reshape(-1, 3) / 255.0
+
+
+def rgb_to_channels(rgb: 'np.ndarray') -> 'np.ndarray':
+    """Quantize an (..., 3) array in [0, 1] into 8-bit integer channels."""
+    return np.rint(np.clip(rgb, 0.0, 1.0) * 255.0).astype(np.int64)
+
+
+def rgb_to_hex(rgb: 'np.ndarray') -> 'np.ndarray':
+    """Convert an (..., 3) array in [0, 1] into `#rrggbb` strings."""
+    return channels_to_hex(rgb_to_channels(rgb))
+
+
+def channels_to_hex(channels: 'np.ndarray') -> 'np.ndarray':
+    """Convert (..., 3) 8-bit integer channels into `#rrggbb` strings."""
+    packed = (channels[..., 0] << 16) | (channels[..., 1] << 8) | channels[..., 2]
+    return np.char.add('#', np.char.zfill(np.char.mod('%x', packed), 6))
+
+
+def srgb_to_linear(rgb: 'np.ndarray') -> 'np.ndarray':
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(linear: 'np.ndarray') -> 'np.ndarray':
+    linear = np.clip(linear, 0.0, 1.0)
+    return np.where(
+        linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1 / 2.4) - 0.055
+    )
+
+
+_RGB_TO_LMS = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005]
+]) if np is not None else None
+
+_LMS_TO_LAB = np.array([
+    [0.2104542553, 0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050, 0.4505937099],
+    [0.0259040371, 0.7827717662, -0.8086757660]
+]) if np is not None else None
+
+_LAB_TO_LMS = np.linalg.inv(_LMS_TO_LAB) if np is not None else None
+_LMS_TO_RGB = np.linalg.inv(_RGB_TO_LMS) if np is not None else None
+
+
+def linear_to_oklch(linear: 'np.ndarray') -> 'np.ndarray':
+    """Convert linear sRGB (..., 3) into OKLCH (..., 3) with hue in degrees."""
+    lms = np.cbrt(linear @ _RGB_TO_LMS.T)
+    lab = lms @ _LMS_TO_LAB.T
+    chroma = np.hypot(lab[..., 1], lab[..., 2])
+    hue = np.degrees(np.arctan2(lab[..., 2], lab[..., 1])) % 360.0
+    return np.stack([lab[..., 0], chroma, hue], axis=-1)
+
+
+def oklch_to_linear(lch: 'np.ndarray') -> 'np.ndarray':
+    """Convert OKLCH (..., 3) back into (unclipped) linear sRGB."""
+    hue = np.radians(lch[..., 2])
+    lab = np.stack(
+        [lch[..., 0], lch[..., 1] * np.cos(hue), lch[..., 1] * np.sin(hue)], axis=-1
+    )
+    lms = (lab @ _LAB_TO_LMS.T) ** 3
+    return lms @ _LMS_TO_RGB.T
+
+
+def _in_gamut(linear: 'np.ndarray') -> 'np.ndarray':
+    return np.all((linear >= -1e-6) & (linear <= 1 + 1e-6), axis=-1)
+
+
+def oklch_to_srgb(lch: 'np.ndarray') -> 'np.ndarray':
+    """
+    Convert OKLCH (..., 3) into gamma-encoded sRGB in [0, 1].
+
+    Out-of-gamut colors keep their lightness and hue while chroma is
+    reduced by bisection, instead of clipping channels and shifting hue.
+    """
+    lch = lch.copy()
+    lch[..., 0] = np.clip(lch[..., 0], 0.0, 1.0)
+    linear = oklch_to_linear(lch)
+    outside = ~_in_gamut(linear)
+    if np.any(outside):
+        low = np.zeros(outside.shape)
+        high = lch[..., 1].copy()
+        candidate = lch.copy()
+        for _ in range(16):
+            candidate[..., 1] = (low + high) / 2
+            fits = _in_gamut(oklch_to_linear(candidate))
+            low = np.where(fits, candidate[..., 1], low)
+            high = np.where(fits, high, candidate[..., 1])
+        lch[..., 1] = np.where(outside, low, lch[..., 1])
+        linear = oklch_to_linear(lch)
+    return linear_to_srgb(linear)
+
+
+def relative_luminance(linear: 'np.ndarray') -> 'np.ndarray':
+    """WCAG relative luminance of clipped linear sRGB colors."""
+    return np.clip(linear, 0.0, 1.0) @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def channels_luminance(channels: 'np.ndarray') -> 'np.ndarray':
+    """WCAG relative luminance of 8-bit channels, using the WCAG 2 formula."""
+    srgb = channels / 255.0
+    linear = np.where(srgb <= 0.03928, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+    return linear @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def contrast_ratio(luminance_a: 'np.ndarray', luminance_b: 'np.ndarray') -> 'np.ndarray':
+    lighter = np.maximum(luminance_a, luminance_b)
+    darker = np.minimum(luminance_a, luminance_b)
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+# === VARIANT GENERATION ===
+
+class VariantGenerator:
+    """Applies palette transforms to a template for a batch of variants."""
+
+    def __init__(self, template: str, background_token: str = '--bg-primary',
+                 tint_tokens: Tuple[str, ...] = ()):
+        self.template = template
+        self.background_token = background_token
+        self.tint_tokens = tint_tokens
+
+        root_rules = [
+            rule for rule in parse_stylesheet(template).rules
+            if not rule.context and rule.selector == ':root'
+        ]
+        if not root_rules:
+            raise SpecError("Template has no :root rule")
+
+        # Last definition wins, matching the cascade
+        declarations: Dict[str, Declaration] = {}
+        for rule in root_rules:
+            for declaration in rule.declarations:
+                if declaration.property.startswith('--') and HEX_COLOR.match(declaration.value):
+                    declarations[declaration.property] = declaration
+        if not declarations:
+            raise SpecError("Template :root defines no hex color variables")
+
+        self.tokens = sorted(declarations, key=lambda name: declarations[name].start)
+        self.declarations = [declarations[name] for name in self.tokens]
+        self.base_lch = linear_to_oklch(
+            srgb_to_linear(hex_to_rgb([declaration.value for declaration in self.declarations]))
+        )
+        self.tint_insert_at = root_rules[-1].end - 1
+
+        missing = [token for token in tint_tokens if token not in declarations]
+        if missing:
+            raise SpecError(f"Tint tokens not defined in template: {', '.join(missing)}")
+
+    def _mask(self, prefixes: Tuple[str, ...]) -> 'np.ndarray':
+        return np.array([token.startswith(prefixes) for token in self.tokens])
+
+    def transform(self, variants: List[Dict]) -> 'np.ndarray':
+        """
+        Compute OKLCH colors for every variant.
+
+        Args:
+            variants: Variant parameter dictionaries
+
+        Returns:
+            Array of shape (variants, tokens, 3)
+        """
+        count = len(variants)
+        hue_shift = np.array([float(v['hue_shift']) for v in variants])[:, None]
+        chroma = np.array([float(v['chroma']) for v in variants])[:, None]
+        dark = np.array([v['mode'] == 'dark' for v in variants])[:, None]
+        contrast = np.array([float(v['contrast']) for v in variants])[:, None]
+
+        lch = np.broadcast_to(self.base_lch, (count,) + self.base_lch.shape).copy()
+        accents = self._mask(ACCENT_PREFIXES)
+        surfaces = self._mask(SURFACE_PREFIXES)
+        text = self._mask(TEXT_PREFIXES)
+
+        # Hue rotation and chroma scaling on accent tokens
+        lch[:, accents, 2] = (lch[:, accents, 2] + hue_shift) % 360.0
+        lch[:, accents, 1] *= chroma
+
+        # Dark variants mirror lightness of surfaces and text
+        flip = dark & (surfaces | text)[None, :]
+        lch[..., 0] = np.where(
+            flip, np.clip(DARK_LIGHTNESS_PIVOT - lch[..., 0], 0.0, 1.0), lch[..., 0]
+        )
+
+        if np.any(contrast > 0) and np.any(text):
+            # The background is only needed to measure contrast against
+            if self.background_token not in self.tokens:
+                raise SpecError(
+                    f"Background token not defined in template: {self.background_token} "
+                    "(set \"background\" in the spec)"
+                )
+            self._enforce_contrast(lch, text, contrast)
+
+        return lch
+
+    def _enforce_contrast(self, lch: 'np.ndarray', text: 'np.ndarray',
+                          target: 'np.ndarray') -> None:
+        """Adjust text lightness until it meets the target contrast ratio."""
+        background = self.tokens.index(self.background_token)
+        bg_luminance = relative_luminance(oklch_to_linear(lch[:, background]))[:, None]
+        text_lch = lch[:, text]
+
+        def contrast_at(lightness: 'np.ndarray') -> 'np.ndarray':
+            candidate = np.stack([lightness, text_lch[..., 1], text_lch[..., 2]], axis=-1)
+            return contrast_ratio(relative_luminance(oklch_to_linear(candidate)), bg_luminance)
+
+        lightness = text_lch[..., 0]
+        needs_fix = contrast_at(lightness) < target
+        if not np.any(needs_fix):
+            return
+
+        # Dark text on light backgrounds, light text on dark ones
+        darken = np.broadcast_to(bg_luminance > 0.18, lightness.shape)
+        low = np.where(darken, 0.0, lightness)
+        high = np.where(darken, lightness, 1.0)
+        for _ in range(24):
+            middle = (low + high) / 2
+            passes = contrast_at(middle) >= target
+            move_low = np.where(darken, passes, ~passes)
+            low = np.where(move_low, middle, low)
+            high = np.where(move_low, high, middle)
+
+        fixed = np.where(darken, low, high)
+        lch[:, text, 0] = np.where(needs_fix, fixed, lightness)
+
+    def tint_scales(self, lch: 'np.ndarray') -> Dict[str, 'np.ndarray']:
+        """Build tint scale hex strings for each tint token across variants."""
+        scales = {}
+        steps = np.array(list(TINT_STEPS.values()))
+        for token in self.tint_tokens:
+            base = lch[:, self.tokens.index(token)]
+            tints = np.repeat(base[:, None, :], len(steps), axis=1)
+            tints[..., 0] = steps
+            scales[token] = rgb_to_hex(oklch_to_srgb(tints))
+        return scales
+
+    def quantize(self, lch: 'np.ndarray', variants: List[Dict]
+                 ) -> Tuple['np.ndarray', List[List[str]]]:
+        """
+        Quantize colors to 8 bits and re-check contrast on the final values.
+
+        Rounding to hex can push text just below its contrast target, so
+        failing text colors are nudged one 8-bit step at a time away from
+        the background until they pass or reach black or white.
+
+        Args:
+            lch: OKLCH colors of shape (variants, tokens, 3)
+            variants: Variant parameter dictionaries
+
+        Returns:
+            Integer channels of shape (variants, tokens, 3) and, per variant,
+            messages for text colors that still miss their contrast target
+        """
+        channels = rgb_to_channels(oklch_to_srgb(lch))
+        unmet: List[List[str]] = [[] for _ in variants]
+        target = np.array([float(v['contrast']) for v in variants])[:, None]
+        text = self._mask(TEXT_PREFIXES)
+        if not np.any(target > 0) or not np.any(text):
+            return channels, unmet
+
+        background = channels[:, self.tokens.index(self.background_token)]
+        bg_luminance = channels_luminance(background)[:, None]
+        text_channels = channels[:, text]
+        darken = np.broadcast_to(bg_luminance > 0.18, text_channels.shape[:2])
+        step = np.where(darken, -1, 1)[..., None]
+        limit = np.where(darken, 0, 255)[..., None]
+
+        for _ in range(256):
+            ratio = contrast_ratio(channels_luminance(text_channels), bg_luminance)
+            failing = ratio < target
+            movable = failing & ~np.all(text_channels == limit, axis=-1)
+            if not np.any(movable):
+                break
+            text_channels = np.where(
+                movable[..., None], np.clip(text_channels + step, 0, 255), text_channels
+            )
+        channels[:, text] = text_channels
+
+        text_tokens = [token for token in self.tokens if token.startswith(TEXT_PREFIXES)]
+        for index, token_index in zip(*np.nonzero(failing)):
+            unmet[index].append(
+                f"{text_tokens[token_index]} reaches {ratio[index, token_index]:.2f}:1, "
+                f"below the {target[index, 0]:g}:1 contrast target"
+            )
+        return channels, unmet
+
+    def render(self, variants: List[Dict]) -> Tuple[List[str], List[List[str]]]:
+        """
+        Render the CSS text of every variant.
+
+        Returns:
+            CSS text per variant, and per variant the contrast targets that
+            could not be met
+        """
+        lch = self.transform(variants)
+        channels, unmet = self.quantize(lch, variants)
+        colors = channels_to_hex(channels).tolist()
+        tint_colors = {token: scale.tolist() for token, scale in self.tint_scales(lch).items()}
+
+        # Split the template once around every edited declaration
+        pieces = []
+        pos = 0
+        for declaration in self.declarations:
+            pieces.append(self.template[pos:declaration.start])
+            pos = declaration.end
+        tail_before = self.template[pos:self.tint_insert_at]
+        tail_after = self.template[self.tint_insert_at:]
+
+        outputs = []
+        for index, variant in enumerate(variants):
+            parts = []
+            for piece, declaration, color in zip(pieces, self.declarations, colors[index]):
+                important = ' !important' if declaration.important else ''
+                parts.append(f"{piece}{declaration.property}: {color}{important};")
+            parts.append(tail_before.rstrip(' '))
+            for token, scale in tint_colors.items():
+                for step, color in zip(TINT_STEPS, scale[index]):
+                    parts.append(f"  {token}-{step}: {color};\n")
+            parts.append(tail_after)
+            outputs.append(''.join(parts).replace('[Your Theme Name]', variant['title']))
+        return outputs, unmet
+
+
+def expand_spec(spec: Dict) -> List[Dict]:
+    """
+    Expand a palette spec into a flat list of variant parameter sets.
+
+    Explicit `variants` are emitted first, followed by the cartesian
+    product of the `matrix` parameters.
+    """
+    prefix = spec.get('prefix', 'variant')
+    variants = []
+
+    for entry in spec.get('variants', []):
+        if 'name' not in entry:
+            raise SpecError("Every entry in 'variants' needs a 'name'")
+        variants.append(dict(entry))
+
+    matrix = spec.get('matrix', {})
+    if matrix:
+        keys = sorted(matrix)
+        for values in itertools.product(*(matrix[key] for key in keys)):
+            suffix = '-'.join(
+                f"{key.split('_')[0]}{value}" for key, value in zip(keys, values)
+            )
+            variants.append(dict(zip(keys, values), name=f"{prefix}-{suffix}"))
+
+    resolved = []
+    seen = set()
+    for entry in variants:
+        unknown = set(entry) - set(DEFAULT_PARAMETERS) - {'name', 'title'}
+        if unknown:
+            raise SpecError(f"Unknown variant parameters: {', '.join(sorted(unknown))}")
+        if entry.get('mode', 'light') not in ('light', 'dark'):
+            raise SpecError(f"Invalid mode for {entry['name']}: {entry['mode']}")
+
+        variant = dict(DEFAULT_PARAMETERS, **entry)
+        variant['name'] = re.sub(r'[^a-z0-9-]+', '-', str(variant['name']).lower()).strip('-')
+        variant.setdefault('title', variant['name'].replace('-', ' ').title())
+        if variant['name'] in seen:
+            raise SpecError(f"Duplicate variant name: {variant['name']}")
+        seen.add(variant['name'])
+        resolved.append(variant)
+
+    if not resolved:
+        raise SpecError("Spec defines no variants")
+    return resolved
+
+
+def _load_validator_class():
+    """Load ThemeValidator from the sibling validate-theme.py script."""
+    script = Path(__file__).with_name('validate-theme.py')
+    spec = importlib.util.spec_from_file_location('validate_theme', script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.ThemeValidator
+
+
+def main():
+    """Main entry point for the variant generator."""
+    parser = argparse.ArgumentParser(
+        description="Generate Tootles theme variants from a palette spec",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Spec example (JSON):
+  {
+    "prefix": "ocean",
+    "template": "templates/basic-template.css",
+    "tints": ["--accent-primary"],
+    "variants": [{"name": "ocean-night", "mode": "dark", "contrast": 7}],
+    "matrix": {"hue_shift": [0, 120, 240], "mode": ["light", "dark"]}
+  }
+
+Examples:
+  %(prog)s palette.json -o themes/ocean/variants/   # Generate and validate
+  %(prog)s palette.json --dry-run                   # Validate without writing
+        """
+    )
+
+    parser.add_argument(
+        'spec',
+        type=Path,
+        help='Path to the JSON palette spec'
+    )
+
+    parser.add_argument(
+        '-t', '--template',
+        type=Path,
+        help='Template CSS file (overrides the spec)'
+    )
+
+    parser.add_argument(
+        '-o', '--output',
+        type=Path,
+        default=Path('variants'),
+        help='Output directory for generated themes (default: variants)'
+    )
+
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Generate and validate without writing files'
+    )
+
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='Treat validation warnings as errors'
+    )
+
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Only show failures and final result'
+    )
+
+    args = parser.parse_args()
+
+    if np is None:
+        print("Error: numpy is required for variant generation (pip install numpy)")
+        return 1
+
+    start = time.perf_counter()
+
+    try:
+        spec = json.loads(args.spec.read_text(encoding='utf-8'))
+        template_path = args.template or Path(spec.get('template', ''))
+        if not template_path.is_file():
+            print(f"Error: Template not found: {template_path}")
+            return 1
+        generator = VariantGenerator(
+            template_path.read_text(encoding='utf-8'),
+            background_token=spec.get('background', '--bg-primary'),
+            tint_tokens=tuple(spec.get('tints', ()))
+        )
+        variants = expand_spec(spec)
+        outputs, unmet_contrast = generator.render(variants)
+    except (OSError, ValueError, SpecError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    if not args.dry_run:
+        args.output.mkdir(parents=True, exist_ok=True)
+
+    validator_class = _load_validator_class()
+    failures = 0
+    for variant, content, unmet in zip(variants, outputs, unmet_contrast):
+        output_file = args.output / f"{variant['name']}.css"
+        validator = validator_class()
+        is_valid = validator.validate_content(content, output_file)
+        if args.strict and validator.warnings:
+            is_valid = False
+        if unmet:
+            # The validator does not check contrast, so report it alongside
+            validator.errors.extend(unmet)
+            is_valid = False
+
+        if not is_valid:
+            # Failing variants are reported but never written
+            failures += 1
+            print(f"\nValidating {output_file.name}...")
+            print(validator.get_validation_report())
+        elif not args.dry_run:
+            output_file.write_text(content, encoding='utf-8')
+            if not args.quiet:
+                print(f"Generated variant: {output_file}")
+
+    elapsed = time.perf_counter() - start
+    if failures:
+        written = '' if args.dry_run else f"; wrote the other {len(variants) - failures}"
+        print(
+            f"\n💥 {failures} of {len(variants)} variant(s) failed validation and "
+            f"were not written{written} ({elapsed:.2f}s)"
+        )
+        return 1
+    print(f"\n✅ Generated and validated {len(variants)} variant(s) in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,26 +7,62 @@ This script generates HTML preview files for CSS themes, allowing developers
 to visualize how their themes look with various UI components and content types.
 """
 
+from __future__ import annotations
+
 import argparse
 import sys
 from pathlib import Path
-from typing import Optional
+
+# typing is only imported by type checkers, keeping startup fast for
+# editors and git hooks
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional
 
 
 class PreviewGenerator:
     """Generates HTML preview files for CSS themes."""
     
-    def __init__(self):
-        self.template_components = {
-            'typography': self._generate_typography_section(),
-            'buttons': self._generate_buttons_section(),
-            'forms': self._generate_forms_section(),
-            'tables': self._generate_tables_section(),
-            'cards': self._generate_cards_section(),
-            'alerts': self._generate_alerts_section(),
-            'code': self._generate_code_section(),
-            'navigation': self._generate_navigation_section()
-        }
+    # Preview sections in display order
+    SECTIONS = (
+        'typography',
+        'buttons',
+        'forms',
+        'tables',
+        'cards',
+        'alerts',
+        'code',
+        'navigation'
+    )
+    
+    def __init__(self, sections: Optional[List[str]] = None):
+        """
+        Set up the generator.
+        
+        Args:
+            sections: Optional subset of SECTIONS to render, in order
+        """
+        if sections is None:
+            sections = list(self.SECTIONS)
+        unknown = [name for name in sections if name not in self.SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown preview sections: {', '.join(unknown)}")
+        
+        self.sections = list(sections)
+        # Section markup is built on first use and reused across previews
+        self._section_cache: Dict[str, str] = {}
+    
+    @property
+    def template_components(self) -> Dict[str, str]:
+        """Markup of the selected sections, keyed by section name."""
+        return {name: self.get_section(name) for name in self.sections}
+    
+    def get_section(self, name: str) -> str:
+        """Return the markup of a single preview section."""
+        if name not in self._section_cache:
+            builder = getattr(self, f"_generate_{name}_section")
+            self._section_cache[name] = builder()
+        return self._section_cache[name]
     
     def generate_preview(self, css_file: Path, output_file: Optional[Path] = None) -> Path:
         """
@@ -157,7 +193,8 @@ class PreviewGenerator:
     def _generate_all_sections(self) -> str:
         """Generate all preview sections."""
         sections = []
-        for section_name, section_content in self.template_components.items():
+        for section_name in self.sections:
+            section_content = self.get_section(section_name)
             sections.append(f"""
         <section class="preview-section">
             <h2>{section_name.title()}</h2>
@@ -417,6 +454,7 @@ Examples:
   %(prog)s theme.css                           # Generate preview for single theme
   %(prog)s theme.css -o custom-preview.html    # Specify output file
   %(prog)s themes/cyberpunk/                   # Generate previews for all themes in directory
+  %(prog)s theme.css --sections buttons,forms  # Only render selected sections
         """
     )
     
@@ -432,6 +470,13 @@ Examples:
         help='Output HTML file path (for single file mode)'
     )
     
+    parser.add_argument(
+        '--sections',
+        type=lambda value: [name.strip() for name in value.split(',') if name.strip()],
+        help='Comma-separated sections to render '
+             f"(default: all; available: {', '.join(PreviewGenerator.SECTIONS)})"
+    )
+    
     parser.add_argument(
         '--open',
         action='store_true',
@@ -444,7 +489,12 @@ Examples:
         print(f"Error: Path does not exist: {args.path}")
         return 1
     
-    generator = PreviewGenerator()
+    try:
+        generator = PreviewGenerator(args.sections)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    
     generated_files = []
     
     try:
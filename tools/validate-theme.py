@@ -8,17 +8,89 @@ for Tootles themes, including proper structure, required variables, and
 accessibility standards.
 """
 
+from __future__ import annotations
+
 import argparse
+import os
 import re
 import sys
+from collections import namedtuple
 from pathlib import Path
-from typing import List
+
+# css_parser and subprocess are imported where used, and typing only by
+# type checkers, keeping startup fast for editors and git hooks
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+    
+    from css_parser import Stylesheet
+
+
+class ImportedStylesheet(namedtuple('ImportedStylesheet', 'variables has_root imports')):
+    """Cached facts about a stylesheet reached through `@import`."""
+    __slots__ = ()
+    variables: FrozenSet[str]
+    has_root: bool
+    imports: Tuple[str, ...]
+
+
+# Process-wide cache so shared base files are read and parsed once per run,
+# keyed by snapshot (None for the working tree, else a git object prefix)
+_import_cache: Dict[Tuple[Optional[str], Path], Optional[ImportedStylesheet]] = {}
+
+
+def _summarize_stylesheet(stylesheet: 'Stylesheet') -> ImportedStylesheet:
+    """Reduce a parsed stylesheet to what cascade-aware validation needs."""
+    variables = set()
+    has_root = False
+    for rule in stylesheet.rules:
+        if ':root' in rule.selector:
+            has_root = True
+        for declaration in rule.declarations:
+            if declaration.property.startswith('--'):
+                variables.add(declaration.property)
+    return ImportedStylesheet(frozenset(variables), has_root, tuple(stylesheet.imports))
+
+
+def load_imported_stylesheet(file_path: Path,
+                             object_reader: Optional['GitObjectReader'] = None
+                             ) -> Optional[ImportedStylesheet]:
+    """
+    Read and summarize an imported stylesheet, using the parse cache.
+    
+    Args:
+        file_path: Resolved path of the imported file
+        object_reader: Optional git snapshot to read from instead of disk
+        
+    Returns:
+        Summary of the stylesheet, or None if it cannot be read
+    """
+    key = (object_reader.object_prefix if object_reader else None, file_path)
+    if key not in _import_cache:
+        from css_parser import parse_stylesheet
+        
+        try:
+            if object_reader is None:
+                content = file_path.read_text(encoding='utf-8')
+            else:
+                data = object_reader.read_path(file_path)
+                content = data.decode('utf-8') if data is not None else None
+        except (OSError, UnicodeDecodeError):
+            content = None
+        
+        if content is None:
+            _import_cache[key] = None
+        else:
+            _import_cache[key] = _summarize_stylesheet(parse_stylesheet(content))
+    return _import_cache[key]
 
 
 class ThemeValidator:
     """Validates CSS theme files for Tootles compatibility."""
     
-    def __init__(self):
+    def __init__(self, object_reader: Optional['GitObjectReader'] = None):
+        # Files reached through @import are read from git when given
+        self.object_reader = object_reader
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.required_variables = {
@@ -65,15 +137,78 @@ class ThemeValidator:
             self.errors.append(f"File must be UTF-8 encoded: {file_path}")
             return False
         
+        return self.validate_content(content, file_path)
+    
+    def validate_content(self, content: str, file_path: Path) -> bool:
+        """
+        Validate CSS theme content that is already in memory.
+        
+        Args:
+            content: CSS content to validate
+            file_path: Path the content belongs to, used in messages
+            
+        Returns:
+            True if validation passes, False otherwise
+        """
+        # Follow @import so requirements see the effective cascade
+        imported = self._resolve_imports(content, file_path)
+        
         # Run validation checks
         self._validate_copyright(content, file_path)
-        self._validate_css_variables(content)
+        self._validate_css_variables(content, imported)
         self._validate_css_syntax(content)
         self._validate_accessibility(content)
-        self._validate_structure(content)
+        self._validate_structure(content, imported)
         
         return len(self.errors) == 0
     
+    def _resolve_imports(self, content: str, file_path: Path) -> List[ImportedStylesheet]:
+        """
+        Collect every stylesheet reachable through `@import`.
+        
+        Missing files and import cycles are reported as errors. Each file
+        is visited once, even when it is imported along several paths.
+        """
+        if '@import' not in content:
+            return []
+        from css_parser import parse_stylesheet, resolve_import_path
+        
+        imports = parse_stylesheet(content).imports
+        if not imports:
+            return []
+        
+        root = file_path.resolve()
+        imported: List[ImportedStylesheet] = []
+        visited: Set[Path] = set()
+        
+        def visit(urls: Tuple[str, ...], importer: Path, chain: Tuple[Path, ...]) -> None:
+            for url in urls:
+                target = resolve_import_path(url, importer)
+                if target is None:
+                    continue
+                if target in chain:
+                    cycle = ' -> '.join(path.name for path in chain + (target,))
+                    self.errors.append(f"Circular @import: {cycle}")
+                    continue
+                if target in visited:
+                    continue
+                visited.add(target)
+                
+                stylesheet = load_imported_stylesheet(target, self.object_reader)
+                if stylesheet is None:
+                    if self.object_reader is None:
+                        self.errors.append(f"Imported file not found or unreadable: {url}")
+                    else:
+                        self.errors.append(
+                            f"Imported file not found in {self.object_reader.description}: {url}"
+                        )
+                    continue
+                visit(stylesheet.imports, target, chain + (target,))
+                imported.append(stylesheet)
+        
+        visit(tuple(imports), root, (root,))
+        return imported
+    
     def _validate_copyright(self, content: str, file_path: Path) -> None:
         """Validate that the file contains proper copyright notice."""
         copyright_pattern = r'/\*.*?Copyright\s+Jascha\s+Wanger\s+2025.*?\*/'
@@ -83,10 +218,13 @@ class ThemeValidator:
                 "Expected: /* ... Copyright Jascha Wanger 2025 ... */"
             )
     
-    def _validate_css_variables(self, content: str) -> None:
+    def _validate_css_variables(self, content: str,
+                                imported: List[ImportedStylesheet]) -> None:
         """Validate that required CSS variables are defined."""
-        # Extract all CSS variables
+        # Extract all CSS variables, including those from imported files
         found_variables = set(re.findall(r'(--[\w-]+)', content))
+        for stylesheet in imported:
+            found_variables |= stylesheet.variables
         
         # Check required variables
         missing_required = self.required_variables - found_variables
@@ -117,7 +255,8 @@ class ThemeValidator:
             self.warnings.append("Possible missing semicolon before closing brace")
         
         # Check for empty rules
-        empty_rules = re.findall(r'[^{}]+\{\s*\}', content)
+        # A lookbehind keeps this linear; `[^{}]+\{` backtracks quadratically
+        empty_rules = re.findall(r'(?<=[^{}])\{\s*\}', content)
         if empty_rules:
             self.warnings.append(f"Found {len(empty_rules)} empty CSS rules")
     
@@ -139,10 +278,12 @@ class ThemeValidator:
                 "Consider adding high contrast mode support for accessibility"
             )
     
-    def _validate_structure(self, content: str) -> None:
+    def _validate_structure(self, content: str,
+                            imported: List[ImportedStylesheet]) -> None:
         """Validate theme structure and organization."""
         # Check for :root selector
-        if not re.search(r':root\s*\{', content):
+        has_root = any(stylesheet.has_root for stylesheet in imported)
+        if not has_root and not re.search(r':root\s*\{', content):
             self.errors.append("Missing :root selector for CSS variables")
         
         # Check for basic element styles
@@ -209,6 +350,195 @@ def validate_theme_directory(theme_dir: Path) -> bool:
     return all_valid
 
 
+class GitError(Exception):
+    """Raised when a git command needed for change detection fails."""
+
+
+def _run_git(args: List[str], cwd: Optional[Path] = None) -> bytes:
+    """Run a git command and return its standard output."""
+    import subprocess
+    
+    try:
+        result = subprocess.run(
+            ['git'] + args,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False
+        )
+    except FileNotFoundError:
+        raise GitError("git executable not found")
+
+    if result.returncode != 0:
+        message = result.stderr.decode('utf-8', 'replace').strip()
+        raise GitError(message or f"git {args[0]} failed")
+    return result.stdout
+
+
+class GitObjectReader:
+    """
+    Reads file contents from git objects through one `git cat-file --batch`.
+    
+    The same long-lived process serves the changed files and any files they
+    `@import`, so everything is validated against one consistent snapshot.
+    """
+    
+    def __init__(self, repo_root: Path, object_prefix: str, description: str):
+        """
+        Start the batch process.
+        
+        Args:
+            repo_root: Resolved repository top-level directory
+            object_prefix: `:` for the index or `<rev>:` for a commit
+            description: Human-readable name of the snapshot for messages
+        """
+        import subprocess
+        
+        self.repo_root = repo_root
+        self.object_prefix = object_prefix
+        self.description = description
+        try:
+            self._process = subprocess.Popen(
+                ['git', 'cat-file', '--batch'],
+                cwd=repo_root,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE
+            )
+        except FileNotFoundError:
+            raise GitError("git executable not found")
+    
+    def __enter__(self) -> 'GitObjectReader':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Stop the batch process."""
+        self._process.stdin.close()
+        self._process.wait()
+        self._process.stdout.close()
+    
+    def read(self, name: str) -> Optional[bytes]:
+        """
+        Read a blob by repository-relative path.
+        
+        Returns:
+            Blob contents, or None if the path is not in the snapshot
+        """
+        if '\n' in name:
+            # Paths with newlines cannot be expressed in the batch protocol
+            return None
+        request = f"{self.object_prefix}{name}\n".encode('utf-8', 'surrogateescape')
+        self._process.stdin.write(request)
+        self._process.stdin.flush()
+        
+        header = self._process.stdout.readline().split()
+        if not header:
+            raise GitError("git cat-file exited unexpectedly")
+        if header[-1] in (b'missing', b'ambiguous'):
+            # `<object> missing`, where the object name may contain spaces
+            return None
+        data = self._process.stdout.read(int(header[2]) + 1)[:-1]
+        return data if header[1] == b'blob' else None
+    
+    def read_path(self, file_path: Path) -> Optional[bytes]:
+        """Read a blob by absolute path, returning None outside the repository."""
+        try:
+            name = file_path.relative_to(self.repo_root)
+        except ValueError:
+            return None
+        return self.read(name.as_posix())
+
+
+def get_changed_css_paths(repo_root: Path, since: Optional[str] = None) -> List[str]:
+    """
+    List CSS files changed in git.
+    
+    Args:
+        repo_root: Repository top-level directory
+        since: Optional revision to compare HEAD against; staged changes
+            are listed when omitted
+        
+    Returns:
+        Repository-relative paths of added, copied, modified or renamed files
+    """
+    if since is None:
+        diff_args = ['diff', '--cached']
+    else:
+        diff_args = ['diff', since, 'HEAD']
+    
+    output = _run_git(
+        diff_args + ['--name-only', '--diff-filter=ACMR', '-z', '--', '*.css', '*.CSS'],
+        cwd=repo_root
+    )
+    return [name for name in output.decode('utf-8', 'surrogateescape').split('\0') if name]
+
+
+def validate_git_changes(since: Optional[str] = None, strict: bool = False,
+                         quiet: bool = False) -> bool:
+    """
+    Validate the CSS files changed in git without touching the working tree.
+    
+    Without a revision, the staged versions of files in the index are read.
+    With a revision, the versions committed in HEAD are read for files that
+    changed between that revision and HEAD. Files reached through `@import`
+    are read from the same snapshot, and all blobs are fetched through a
+    single `git cat-file --batch` process.
+    
+    Args:
+        since: Optional revision; validates staged files when omitted
+        strict: Treat warnings as errors
+        quiet: Only show errors and final result
+        
+    Returns:
+        True if all validations pass, False otherwise
+    """
+    top_level = _run_git(['rev-parse', '--show-toplevel']).decode('utf-8').strip()
+    repo_root = Path(top_level).resolve()
+    
+    paths = get_changed_css_paths(repo_root, since)
+    if not paths:
+        if not quiet:
+            source = "staged" if since is None else f"since {since}"
+            print(f"No changed CSS files {source}")
+        return True
+    
+    if since is None:
+        reader = GitObjectReader(repo_root, ':', "the git index")
+    else:
+        reader = GitObjectReader(repo_root, 'HEAD:', "HEAD")
+    
+    all_valid = True
+    cwd = Path.cwd()
+    with reader:
+        for name in paths:
+            file_path = repo_root / name
+            display_path = Path(os.path.relpath(file_path, cwd))
+            data = reader.read(name)
+            if data is None:
+                raise GitError(f"Could not read {reader.object_prefix}{name} from git")
+            
+            validator = ThemeValidator(object_reader=reader)
+            try:
+                is_valid = validator.validate_content(data.decode('utf-8'), file_path)
+            except UnicodeDecodeError:
+                validator.errors.append(f"File must be UTF-8 encoded: {display_path}")
+                is_valid = False
+            
+            if strict and validator.warnings:
+                is_valid = False
+            
+            if not quiet or not is_valid:
+                print(f"\nValidating {display_path}...")
+                print(validator.get_validation_report())
+            
+            if not is_valid:
+                all_valid = False
+    
+    return all_valid
+
+
 def main():
     """Main entry point for the theme validator."""
     parser = argparse.ArgumentParser(
@@ -219,15 +549,30 @@ Examples:
   %(prog)s theme.css                    # Validate single file
   %(prog)s themes/cyberpunk/            # Validate directory
   %(prog)s --strict theme.css           # Treat warnings as errors
+  %(prog)s --staged                     # Validate CSS files staged in git
+  %(prog)s --since origin/main          # Validate CSS files changed since a revision
         """
     )
     
     parser.add_argument(
         'path',
         type=Path,
+        nargs='?',
         help='Path to CSS file or directory to validate'
     )
     
+    git_group = parser.add_mutually_exclusive_group()
+    git_group.add_argument(
+        '--staged',
+        action='store_true',
+        help='Validate the staged contents of changed CSS files in git'
+    )
+    git_group.add_argument(
+        '--since',
+        metavar='REV',
+        help='Validate CSS files changed between REV and HEAD'
+    )
+    
     parser.add_argument(
         '--strict',
         action='store_true',
@@ -242,6 +587,19 @@ Examples:
     
     args = parser.parse_args()
     
+    if args.staged or args.since:
+        if args.path is not None:
+            parser.error("path cannot be combined with --staged or --since")
+        try:
+            success = validate_git_changes(args.since, args.strict, args.quiet)
+        except GitError as e:
+            print(f"Error: {e}")
+            return 1
+        return _report_result(success, args.quiet)
+    
+    if args.path is None:
+        parser.error("a path is required unless --staged or --since is given")
+    
     if not args.path.exists():
         print(f"Error: Path does not exist: {args.path}")
         return 1
@@ -280,12 +638,17 @@ Examples:
         print(f"Error: Path must be a file or directory: {args.path}")
         return 1
     
+    return _report_result(success, args.quiet)
+
+
+def _report_result(success: bool, quiet: bool) -> int:
+    """Print the final result and return the process exit code."""
     if success:
-        if not args.quiet:
+        if not quiet:
             print("\n🎉 All validations passed!")
         return 0
     else:
-        if not args.quiet:
+        if not quiet:
             print("\n💥 Validation failed!")
         return 1
 